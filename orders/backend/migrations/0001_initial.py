@@ -7,6 +7,131 @@ from django.db import migrations, models
 import django.db.models.deletion
 import django.utils.timezone
 
+# Схема целиком одним блоком DDL: таблицы создаются сразу со всеми колонками,
+# без пересборки таблиц и отдельного запроса на каждую операцию.
+CREATE_ALL_SQL = {
+    'postgresql': """
+    CREATE TABLE "backend_user" ("id" serial NOT NULL PRIMARY KEY, "password" varchar(128) NOT NULL, "last_login" timestamp with time zone NULL, "is_superuser" boolean NOT NULL, "first_name" varchar(30) NOT NULL, "last_name" varchar(150) NOT NULL, "is_staff" boolean NOT NULL, "date_joined" timestamp with time zone NOT NULL, "email" varchar(254) NOT NULL UNIQUE, "company" varchar(40) NOT NULL, "position" varchar(40) NOT NULL, "username" varchar(150) NOT NULL, "is_active" boolean NOT NULL, "type" varchar(5) NOT NULL);
+    CREATE TABLE "backend_user_groups" ("id" serial NOT NULL PRIMARY KEY, "user_id" integer NOT NULL, "group_id" integer NOT NULL);
+    CREATE TABLE "backend_user_user_permissions" ("id" serial NOT NULL PRIMARY KEY, "user_id" integer NOT NULL, "permission_id" integer NOT NULL);
+    CREATE TABLE "backend_category" ("id" serial NOT NULL PRIMARY KEY, "name" varchar(50) NOT NULL);
+    CREATE TABLE "backend_order" ("id" serial NOT NULL PRIMARY KEY, "dt" timestamp with time zone NOT NULL, "status" varchar(50) NOT NULL, "user_id" integer NOT NULL);
+    CREATE TABLE "backend_parameter" ("id" serial NOT NULL PRIMARY KEY, "name" varchar(100) NOT NULL);
+    CREATE TABLE "backend_product" ("id" serial NOT NULL PRIMARY KEY, "name" varchar(50) NOT NULL, "category_id" integer NULL);
+    CREATE TABLE "backend_productinfo" ("id" serial NOT NULL PRIMARY KEY, "quantity" integer NOT NULL CHECK ("quantity" >= 0), "price" numeric(10, 2) NOT NULL, "price_rrc" numeric(10, 2) NOT NULL, "product_id" integer NOT NULL, "shop_id" integer NOT NULL);
+    CREATE TABLE "backend_shop" ("id" serial NOT NULL PRIMARY KEY, "name" varchar(100) NOT NULL, "url" varchar(200) NOT NULL, "filename" varchar(50) NOT NULL);
+    CREATE TABLE "backend_productparameter" ("id" serial NOT NULL PRIMARY KEY, "value" varchar(300) NOT NULL, "parameter_id" integer NOT NULL, "product_info_id" integer NOT NULL);
+    CREATE TABLE "backend_orderitem" ("id" serial NOT NULL PRIMARY KEY, "quantity" integer NOT NULL CHECK ("quantity" >= 0), "order_id" integer NOT NULL, "product_id" integer NOT NULL, "shop_id" integer NOT NULL);
+    CREATE TABLE "backend_contact" ("id" serial NOT NULL PRIMARY KEY, "city" varchar(30) NOT NULL, "street" varchar(50) NOT NULL, "house" varchar(5) NOT NULL, "apartment" varchar(5) NULL, "phone" varchar(15) NOT NULL, "email" varchar(30) NOT NULL, "user_id" integer NOT NULL);
+    CREATE TABLE "backend_category_shops" ("id" serial NOT NULL PRIMARY KEY, "category_id" integer NOT NULL, "shop_id" integer NOT NULL);
+    CREATE INDEX "backend_user_email_8d26f8ca_like" ON "backend_user" ("email" varchar_pattern_ops);
+    ALTER TABLE "backend_user_groups" ADD CONSTRAINT "backend_user_groups_user_id_d2c44525_fk_backend_user_id" FOREIGN KEY ("user_id") REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_user_groups" ADD CONSTRAINT "backend_user_groups_group_id_df691386_fk_auth_group_id" FOREIGN KEY ("group_id") REFERENCES "auth_group" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_user_groups" ADD CONSTRAINT "backend_user_groups_user_id_group_id_decc787e_uniq" UNIQUE ("user_id", "group_id");
+    CREATE INDEX "backend_user_groups_user_id_d2c44525" ON "backend_user_groups" ("user_id");
+    CREATE INDEX "backend_user_groups_group_id_df691386" ON "backend_user_groups" ("group_id");
+    ALTER TABLE "backend_user_user_permissions" ADD CONSTRAINT "backend_user_user_pe_user_id_439140a5_fk_backend_u" FOREIGN KEY ("user_id") REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_user_user_permissions" ADD CONSTRAINT "backend_user_user_pe_permission_id_634ab7e4_fk_auth_perm" FOREIGN KEY ("permission_id") REFERENCES "auth_permission" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_user_user_permissions" ADD CONSTRAINT "backend_user_user_permis_user_id_permission_id_d232313e_uniq" UNIQUE ("user_id", "permission_id");
+    CREATE INDEX "backend_user_user_permissions_user_id_439140a5" ON "backend_user_user_permissions" ("user_id");
+    CREATE INDEX "backend_user_user_permissions_permission_id_634ab7e4" ON "backend_user_user_permissions" ("permission_id");
+    ALTER TABLE "backend_order" ADD CONSTRAINT "backend_order_user_id_0d1a9b55_fk_backend_user_id" FOREIGN KEY ("user_id") REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_order_user_id_0d1a9b55" ON "backend_order" ("user_id");
+    ALTER TABLE "backend_product" ADD CONSTRAINT "backend_product_category_id_d4f6d780_fk_backend_category_id" FOREIGN KEY ("category_id") REFERENCES "backend_category" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_product_category_id_d4f6d780" ON "backend_product" ("category_id");
+    ALTER TABLE "backend_productinfo" ADD CONSTRAINT "backend_productinfo_product_id_0b5ac037_fk_backend_product_id" FOREIGN KEY ("product_id") REFERENCES "backend_product" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_productinfo_product_id_0b5ac037" ON "backend_productinfo" ("product_id");
+    ALTER TABLE "backend_productparameter" ADD CONSTRAINT "backend_productparam_parameter_id_e6c097bd_fk_backend_p" FOREIGN KEY ("parameter_id") REFERENCES "backend_parameter" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_productparameter" ADD CONSTRAINT "backend_productparam_product_info_id_b13ca2fb_fk_backend_p" FOREIGN KEY ("product_info_id") REFERENCES "backend_productinfo" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_productparameter_parameter_id_e6c097bd" ON "backend_productparameter" ("parameter_id");
+    CREATE INDEX "backend_productparameter_product_info_id_b13ca2fb" ON "backend_productparameter" ("product_info_id");
+    CREATE INDEX "backend_productinfo_shop_id_8278856b" ON "backend_productinfo" ("shop_id");
+    ALTER TABLE "backend_productinfo" ADD CONSTRAINT "backend_productinfo_shop_id_8278856b_fk_backend_shop_id" FOREIGN KEY ("shop_id") REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_orderitem" ADD CONSTRAINT "backend_orderitem_order_id_fcf86ec5_fk_backend_order_id" FOREIGN KEY ("order_id") REFERENCES "backend_order" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_orderitem" ADD CONSTRAINT "backend_orderitem_product_id_b45f2dc0_fk_backend_product_id" FOREIGN KEY ("product_id") REFERENCES "backend_product" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_orderitem" ADD CONSTRAINT "backend_orderitem_shop_id_baab56d7_fk_backend_shop_id" FOREIGN KEY ("shop_id") REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_orderitem_order_id_fcf86ec5" ON "backend_orderitem" ("order_id");
+    CREATE INDEX "backend_orderitem_product_id_b45f2dc0" ON "backend_orderitem" ("product_id");
+    CREATE INDEX "backend_orderitem_shop_id_baab56d7" ON "backend_orderitem" ("shop_id");
+    ALTER TABLE "backend_contact" ADD CONSTRAINT "backend_contact_user_id_04827af6_fk_backend_user_id" FOREIGN KEY ("user_id") REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX "backend_contact_user_id_04827af6" ON "backend_contact" ("user_id");
+    ALTER TABLE "backend_category_shops" ADD CONSTRAINT "backend_category_sho_category_id_70d5b5e1_fk_backend_c" FOREIGN KEY ("category_id") REFERENCES "backend_category" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_category_shops" ADD CONSTRAINT "backend_category_shops_shop_id_cc8faf09_fk_backend_shop_id" FOREIGN KEY ("shop_id") REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE "backend_category_shops" ADD CONSTRAINT "backend_category_shops_category_id_shop_id_9ab4d07b_uniq" UNIQUE ("category_id", "shop_id");
+    CREATE INDEX "backend_category_shops_category_id_70d5b5e1" ON "backend_category_shops" ("category_id");
+    CREATE INDEX "backend_category_shops_shop_id_cc8faf09" ON "backend_category_shops" ("shop_id");
+    """,
+    'sqlite': """
+    CREATE TABLE "backend_user" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "password" varchar(128) NOT NULL, "last_login" datetime NULL, "is_superuser" bool NOT NULL, "first_name" varchar(30) NOT NULL, "last_name" varchar(150) NOT NULL, "is_staff" bool NOT NULL, "date_joined" datetime NOT NULL, "email" varchar(254) NOT NULL UNIQUE, "company" varchar(40) NOT NULL, "position" varchar(40) NOT NULL, "username" varchar(150) NOT NULL, "is_active" bool NOT NULL, "type" varchar(5) NOT NULL);
+    CREATE TABLE "backend_user_groups" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "user_id" integer NOT NULL REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED, "group_id" integer NOT NULL REFERENCES "auth_group" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_user_user_permissions" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "user_id" integer NOT NULL REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED, "permission_id" integer NOT NULL REFERENCES "auth_permission" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_category" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "name" varchar(50) NOT NULL);
+    CREATE TABLE "backend_order" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "dt" datetime NOT NULL, "status" varchar(50) NOT NULL, "user_id" integer NOT NULL REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_parameter" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "name" varchar(100) NOT NULL);
+    CREATE TABLE "backend_product" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "name" varchar(50) NOT NULL, "category_id" integer NULL REFERENCES "backend_category" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_shop" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "name" varchar(100) NOT NULL, "url" varchar(200) NOT NULL, "filename" varchar(50) NOT NULL);
+    CREATE TABLE "backend_productinfo" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "quantity" integer unsigned NOT NULL CHECK ("quantity" >= 0), "price" decimal NOT NULL, "price_rrc" decimal NOT NULL, "product_id" integer NOT NULL REFERENCES "backend_product" ("id") DEFERRABLE INITIALLY DEFERRED, "shop_id" integer NOT NULL REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_productparameter" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "value" varchar(300) NOT NULL, "parameter_id" integer NOT NULL REFERENCES "backend_parameter" ("id") DEFERRABLE INITIALLY DEFERRED, "product_info_id" integer NOT NULL REFERENCES "backend_productinfo" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_orderitem" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "quantity" integer unsigned NOT NULL CHECK ("quantity" >= 0), "order_id" integer NOT NULL REFERENCES "backend_order" ("id") DEFERRABLE INITIALLY DEFERRED, "product_id" integer NOT NULL REFERENCES "backend_product" ("id") DEFERRABLE INITIALLY DEFERRED, "shop_id" integer NOT NULL REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_contact" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "city" varchar(30) NOT NULL, "street" varchar(50) NOT NULL, "house" varchar(5) NOT NULL, "apartment" varchar(5) NULL, "phone" varchar(15) NOT NULL, "email" varchar(30) NOT NULL, "user_id" integer NOT NULL REFERENCES "backend_user" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE TABLE "backend_category_shops" ("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "category_id" integer NOT NULL REFERENCES "backend_category" ("id") DEFERRABLE INITIALLY DEFERRED, "shop_id" integer NOT NULL REFERENCES "backend_shop" ("id") DEFERRABLE INITIALLY DEFERRED);
+    CREATE UNIQUE INDEX "backend_user_groups_user_id_group_id_decc787e_uniq" ON "backend_user_groups" ("user_id", "group_id");
+    CREATE INDEX "backend_user_groups_user_id_d2c44525" ON "backend_user_groups" ("user_id");
+    CREATE INDEX "backend_user_groups_group_id_df691386" ON "backend_user_groups" ("group_id");
+    CREATE UNIQUE INDEX "backend_user_user_permissions_user_id_permission_id_d232313e_uniq" ON "backend_user_user_permissions" ("user_id", "permission_id");
+    CREATE INDEX "backend_user_user_permissions_user_id_439140a5" ON "backend_user_user_permissions" ("user_id");
+    CREATE INDEX "backend_user_user_permissions_permission_id_634ab7e4" ON "backend_user_user_permissions" ("permission_id");
+    CREATE INDEX "backend_order_user_id_0d1a9b55" ON "backend_order" ("user_id");
+    CREATE INDEX "backend_product_category_id_d4f6d780" ON "backend_product" ("category_id");
+    CREATE INDEX "backend_productinfo_product_id_0b5ac037" ON "backend_productinfo" ("product_id");
+    CREATE INDEX "backend_productinfo_shop_id_8278856b" ON "backend_productinfo" ("shop_id");
+    CREATE INDEX "backend_productparameter_parameter_id_e6c097bd" ON "backend_productparameter" ("parameter_id");
+    CREATE INDEX "backend_productparameter_product_info_id_b13ca2fb" ON "backend_productparameter" ("product_info_id");
+    CREATE INDEX "backend_orderitem_order_id_fcf86ec5" ON "backend_orderitem" ("order_id");
+    CREATE INDEX "backend_orderitem_product_id_b45f2dc0" ON "backend_orderitem" ("product_id");
+    CREATE INDEX "backend_orderitem_shop_id_baab56d7" ON "backend_orderitem" ("shop_id");
+    CREATE INDEX "backend_contact_user_id_04827af6" ON "backend_contact" ("user_id");
+    CREATE UNIQUE INDEX "backend_category_shops_category_id_shop_id_9ab4d07b_uniq" ON "backend_category_shops" ("category_id", "shop_id");
+    CREATE INDEX "backend_category_shops_category_id_70d5b5e1" ON "backend_category_shops" ("category_id");
+    CREATE INDEX "backend_category_shops_shop_id_cc8faf09" ON "backend_category_shops" ("shop_id");
+    """,
+}
+
+DROP_ALL_SQL = """
+DROP TABLE "backend_category_shops";
+DROP TABLE "backend_contact";
+DROP TABLE "backend_orderitem";
+DROP TABLE "backend_productparameter";
+DROP TABLE "backend_productinfo";
+DROP TABLE "backend_shop";
+DROP TABLE "backend_product";
+DROP TABLE "backend_parameter";
+DROP TABLE "backend_order";
+DROP TABLE "backend_category";
+DROP TABLE "backend_user_user_permissions";
+DROP TABLE "backend_user_groups";
+DROP TABLE "backend_user";
+"""
+
+
+def _statements(sql):
+    return [statement.strip() for statement in sql.split(';') if statement.strip()]
+
+
+def create_schema(apps, schema_editor):
+    sql = CREATE_ALL_SQL[schema_editor.connection.vendor]
+    if schema_editor.connection.vendor == 'sqlite':
+        # sqlite3 выполняет только одну команду за вызов
+        for statement in _statements(sql):
+            schema_editor.execute(statement)
+    else:
+        schema_editor.execute(sql)
+
+
+def drop_schema(apps, schema_editor):
+    for statement in _statements(DROP_ALL_SQL):
+        schema_editor.execute(statement)
+
 
 class Migration(migrations.Migration):
 
@@ -17,136 +142,143 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.CreateModel(
-            name='User',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('password', models.CharField(max_length=128, verbose_name='password')),
-                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
-                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
-                ('first_name', models.CharField(blank=True, max_length=30, verbose_name='first name')),
-                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
-                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
-                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
-                ('email', models.EmailField(max_length=254, unique=True, verbose_name='email address')),
-                ('company', models.CharField(blank=True, max_length=40, verbose_name='Компания')),
-                ('position', models.CharField(blank=True, max_length=40, verbose_name='Должность')),
-                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
-                ('is_active', models.BooleanField(default=False, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
-                ('type', models.CharField(choices=[('shop', 'Магазин'), ('customer', 'Покупатель')], default='buyer', max_length=5, verbose_name='Тип пользователя')),
-                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.Group', verbose_name='groups')),
-                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.Permission', verbose_name='user permissions')),
-            ],
-            options={
-                'verbose_name': 'Пользователь',
-                'verbose_name_plural': 'Список пользователей',
-                'ordering': ('email',),
-            },
-            managers=[
-                ('objects', backend.models.UserManager()),
-            ],
-        ),
-        migrations.CreateModel(
-            name='Category',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=50)),
-            ],
-            options={
-                'verbose_name': 'Категория',
-                'verbose_name_plural': 'Категории',
-            },
-        ),
-        migrations.CreateModel(
-            name='Order',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('dt', models.DateTimeField()),
-                ('status', models.CharField(choices=[('basket', 'В корзине'), ('confirmed', 'Подтвержден'), ('assembled', 'Собран'), ('sent', 'Отправлен'), ('delivered', 'Выполнен'), ('cancelled', 'Отменен')], max_length=50)),
-                ('user', models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, related_name='user_order', to=settings.AUTH_USER_MODEL)),
-            ],
-        ),
-        migrations.CreateModel(
-            name='Parameter',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=100, verbose_name='Название')),
-            ],
-        ),
-        migrations.CreateModel(
-            name='Product',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=50)),
-                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shop', to='backend.Category')),
-            ],
-        ),
-        migrations.CreateModel(
-            name='ProductInfo',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('quantity', models.PositiveIntegerField()),
-                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Цена')),
-                ('price_rrc', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Рекомендуемая розничная цена')),
-                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product', to='backend.Product')),
-            ],
-        ),
-        migrations.CreateModel(
-            name='Shop',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=100)),
-                ('url', models.URLField()),
-                ('filename', models.CharField(max_length=50)),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_schema, drop_schema),
             ],
-            options={
-                'verbose_name': 'Магазин',
-                'verbose_name_plural': 'Магазины',
-            },
-        ),
-        migrations.CreateModel(
-            name='ProductParameter',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('value', models.CharField(max_length=300, verbose_name='Значение')),
-                ('parameter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parameter', to='backend.Parameter', verbose_name='Параметр')),
-                ('product_info', models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, related_name='product_info', to='backend.ProductInfo')),
-            ],
-        ),
-        migrations.AddField(
-            model_name='productinfo',
-            name='shop',
-            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shop_product', to='backend.Shop'),
-        ),
-        migrations.CreateModel(
-            name='OrderItem',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('quantity', models.PositiveIntegerField(default=1)),
-                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order', to='backend.Order')),
-                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_order_item', to='backend.Product')),
-                ('shop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shop_order', to='backend.Shop')),
+            state_operations=[
+                migrations.CreateModel(
+                    name='User',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('password', models.CharField(max_length=128, verbose_name='password')),
+                        ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                        ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                        ('first_name', models.CharField(blank=True, max_length=30, verbose_name='first name')),
+                        ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                        ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                        ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                        ('email', models.EmailField(max_length=254, unique=True, verbose_name='email address')),
+                        ('company', models.CharField(blank=True, max_length=40, verbose_name='Компания')),
+                        ('position', models.CharField(blank=True, max_length=40, verbose_name='Должность')),
+                        ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                        ('is_active', models.BooleanField(default=False, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                        ('type', models.CharField(choices=[('shop', 'Магазин'), ('customer', 'Покупатель')], default='buyer', max_length=5, verbose_name='Тип пользователя')),
+                        ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.Group', verbose_name='groups')),
+                        ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.Permission', verbose_name='user permissions')),
+                    ],
+                    options={
+                        'verbose_name': 'Пользователь',
+                        'verbose_name_plural': 'Список пользователей',
+                        'ordering': ('email',),
+                    },
+                    managers=[
+                        ('objects', backend.models.UserManager()),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='Category',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('name', models.CharField(max_length=50)),
+                    ],
+                    options={
+                        'verbose_name': 'Категория',
+                        'verbose_name_plural': 'Категории',
+                    },
+                ),
+                migrations.CreateModel(
+                    name='Order',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('dt', models.DateTimeField()),
+                        ('status', models.CharField(choices=[('basket', 'В корзине'), ('confirmed', 'Подтвержден'), ('assembled', 'Собран'), ('sent', 'Отправлен'), ('delivered', 'Выполнен'), ('cancelled', 'Отменен')], max_length=50)),
+                        ('user', models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, related_name='user_order', to=settings.AUTH_USER_MODEL)),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='Parameter',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('name', models.CharField(max_length=100, verbose_name='Название')),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='Product',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('name', models.CharField(max_length=50)),
+                        ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shop', to='backend.Category')),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='ProductInfo',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('quantity', models.PositiveIntegerField()),
+                        ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Цена')),
+                        ('price_rrc', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Рекомендуемая розничная цена')),
+                        ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product', to='backend.Product')),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='Shop',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('name', models.CharField(max_length=100)),
+                        ('url', models.URLField()),
+                        ('filename', models.CharField(max_length=50)),
+                    ],
+                    options={
+                        'verbose_name': 'Магазин',
+                        'verbose_name_plural': 'Магазины',
+                    },
+                ),
+                migrations.CreateModel(
+                    name='ProductParameter',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('value', models.CharField(max_length=300, verbose_name='Значение')),
+                        ('parameter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parameter', to='backend.Parameter', verbose_name='Параметр')),
+                        ('product_info', models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, related_name='product_info', to='backend.ProductInfo')),
+                    ],
+                ),
+                migrations.AddField(
+                    model_name='productinfo',
+                    name='shop',
+                    field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shop_product', to='backend.Shop'),
+                ),
+                migrations.CreateModel(
+                    name='OrderItem',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('quantity', models.PositiveIntegerField(default=1)),
+                        ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order', to='backend.Order')),
+                        ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_order_item', to='backend.Product')),
+                        ('shop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shop_order', to='backend.Shop')),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='Contact',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('city', models.CharField(max_length=30, verbose_name='Город')),
+                        ('street', models.CharField(max_length=50, verbose_name='Улица')),
+                        ('house', models.CharField(max_length=5, verbose_name='Дом')),
+                        ('apartment', models.CharField(max_length=5, null=True, verbose_name='Квартира')),
+                        ('phone', models.CharField(max_length=15, verbose_name='Телефон')),
+                        ('email', models.CharField(max_length=30, verbose_name='Email')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_contact', to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'verbose_name': 'Контактная информация пользователя',
+                    },
+                ),
+                migrations.AddField(
+                    model_name='category',
+                    name='shops',
+                    field=models.ManyToManyField(related_name='shop_category', to='backend.Shop'),
+                ),
             ],
         ),
-        migrations.CreateModel(
-            name='Contact',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('city', models.CharField(max_length=30, verbose_name='Город')),
-                ('street', models.CharField(max_length=50, verbose_name='Улица')),
-                ('house', models.CharField(max_length=5, verbose_name='Дом')),
-                ('apartment', models.CharField(max_length=5, null=True, verbose_name='Квартира')),
-                ('phone', models.CharField(max_length=15, verbose_name='Телефон')),
-                ('email', models.CharField(max_length=30, verbose_name='Email')),
-                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_contact', to=settings.AUTH_USER_MODEL)),
-            ],
-            options={
-                'verbose_name': 'Контактная информация пользователя',
-            },
-        ),
-        migrations.AddField(
-            model_name='category',
-            name='shops',
-            field=models.ManyToManyField(related_name='shop_category', to='backend.Shop'),
-        ),
     ]
@@ -4,52 +4,90 @@ from django.conf import settings
 from django.db import migrations, models
 import django.db.models.deletion
 
+KEY_INDEX_SQL = 'CREATE UNIQUE INDEX {concurrently} "backend_confirmemailtoken_key_key" ' \
+                'ON "backend_confirmemailtoken" ("key")'
+
+
+def create_key_index(apps, schema_editor):
+    """
+    Уникальный индекс по ключу строится без блокировки записи в таблицу (на Postgres)
+    """
+    concurrently = 'CONCURRENTLY' if schema_editor.connection.vendor == 'postgresql' else ''
+    schema_editor.execute(KEY_INDEX_SQL.format(concurrently=concurrently))
+
 
 class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    atomic = False
 
     dependencies = [
         ('backend', '0002_auto_20210218_1513'),
     ]
 
     operations = [
-        migrations.AlterModelOptions(
-            name='contact',
-            options={'verbose_name': 'Контактная информация пользователя', 'verbose_name_plural': 'Информация о контактах пользователей'},
-        ),
-        migrations.AlterModelOptions(
-            name='order',
-            options={'verbose_name': 'Заказ', 'verbose_name_plural': 'Заказы'},
-        ),
-        migrations.AlterModelOptions(
-            name='orderitem',
-            options={'verbose_name': 'Заказанная позиция', 'verbose_name_plural': 'Список заказанных позиций'},
-        ),
-        migrations.AlterField(
-            model_name='category',
-            name='name',
-            field=models.CharField(max_length=50, verbose_name='Категория'),
-        ),
-        migrations.AlterField(
-            model_name='product',
-            name='name',
-            field=models.CharField(max_length=50, verbose_name='Название'),
-        ),
-        migrations.AlterField(
-            model_name='productinfo',
-            name='quantity',
-            field=models.PositiveIntegerField(verbose_name='Количество'),
+        # изменения только в описании моделей, схему БД не затрагивают
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterModelOptions(
+                    name='contact',
+                    options={'verbose_name': 'Контактная информация пользователя', 'verbose_name_plural': 'Информация о контактах пользователей'},
+                ),
+                migrations.AlterModelOptions(
+                    name='order',
+                    options={'verbose_name': 'Заказ', 'verbose_name_plural': 'Заказы'},
+                ),
+                migrations.AlterModelOptions(
+                    name='orderitem',
+                    options={'verbose_name': 'Заказанная позиция', 'verbose_name_plural': 'Список заказанных позиций'},
+                ),
+                migrations.AlterField(
+                    model_name='category',
+                    name='name',
+                    field=models.CharField(max_length=50, verbose_name='Категория'),
+                ),
+                migrations.AlterField(
+                    model_name='product',
+                    name='name',
+                    field=models.CharField(max_length=50, verbose_name='Название'),
+                ),
+                migrations.AlterField(
+                    model_name='productinfo',
+                    name='quantity',
+                    field=models.PositiveIntegerField(verbose_name='Количество'),
+                ),
+            ],
         ),
-        migrations.CreateModel(
-            name='ConfirmEmailToken',
-            fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='When was this token generated')),
-                ('key', models.CharField(db_index=True, max_length=64, unique=True, verbose_name='Key')),
-                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='confirm_email_tokens', to=settings.AUTH_USER_MODEL, verbose_name='The User which is associated to this password reset token')),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.CreateModel(
+                    name='ConfirmEmailToken',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='When was this token generated')),
+                        ('key', models.CharField(max_length=64, verbose_name='Key')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='confirm_email_tokens', to=settings.AUTH_USER_MODEL, verbose_name='The User which is associated to this password reset token')),
+                    ],
+                    options={
+                        'verbose_name': 'Токен подтверждения Email',
+                        'verbose_name_plural': 'Токены подтверждения Email',
+                    },
+                ),
+                migrations.RunPython(create_key_index, migrations.RunPython.noop, atomic=False),
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name='ConfirmEmailToken',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='When was this token generated')),
+                        ('key', models.CharField(db_index=True, max_length=64, unique=True, verbose_name='Key')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='confirm_email_tokens', to=settings.AUTH_USER_MODEL, verbose_name='The User which is associated to this password reset token')),
+                    ],
+                    options={
+                        'verbose_name': 'Токен подтверждения Email',
+                        'verbose_name_plural': 'Токены подтверждения Email',
+                    },
+                ),
             ],
-            options={
-                'verbose_name': 'Токен подтверждения Email',
-                'verbose_name_plural': 'Токены подтверждения Email',
-            },
         ),
     ]
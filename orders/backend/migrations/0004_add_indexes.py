@@ -0,0 +1,31 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0003_auto_20210219_1310'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='status',
+            field=models.CharField(choices=[('basket', 'В корзине'), ('confirmed', 'Подтвержден'), ('assembled', 'Собран'), ('sent', 'Отправлен'), ('delivered', 'Выполнен'), ('cancelled', 'Отменен')], db_index=True, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='type',
+            field=models.CharField(choices=[('shop', 'Магазин'), ('customer', 'Покупатель')], db_index=True, default='buyer', max_length=5, verbose_name='Тип пользователя'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'status'], name='backend_ord_user_id_24dc94_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productinfo',
+            index=models.Index(fields=['shop', 'product'], name='backend_pro_shop_id_c479b9_idx'),
+        ),
+    ]
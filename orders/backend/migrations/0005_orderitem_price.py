@@ -0,0 +1,40 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0004_add_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Цена'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='price_rrc',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Рекомендуемая розничная цена'),
+            preserve_default=False,
+        ),
+        # переносим цены из прайса одним UPDATE, без обхода позиций в Python
+        migrations.RunSQL(
+            sql="""
+                UPDATE backend_orderitem
+                SET price = COALESCE((SELECT pi.price FROM backend_productinfo pi
+                                      WHERE pi.product_id = backend_orderitem.product_id
+                                        AND pi.shop_id = backend_orderitem.shop_id
+                                      LIMIT 1), 0),
+                    price_rrc = COALESCE((SELECT pi.price_rrc FROM backend_productinfo pi
+                                          WHERE pi.product_id = backend_orderitem.product_id
+                                            AND pi.shop_id = backend_orderitem.shop_id
+                                          LIMIT 1), 0)
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
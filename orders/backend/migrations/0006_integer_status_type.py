@@ -0,0 +1,50 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0005_orderitem_price'),
+    ]
+
+    operations = [
+        # строковые значения переводим в коды одним UPDATE, затем меняем тип колонки
+        migrations.RunSQL(
+            sql="""
+                UPDATE backend_order SET status = CASE status
+                    WHEN 'basket' THEN '0'
+                    WHEN 'confirmed' THEN '1'
+                    WHEN 'assembled' THEN '2'
+                    WHEN 'sent' THEN '3'
+                    WHEN 'delivered' THEN '4'
+                    WHEN 'cancelled' THEN '5'
+                END
+            """,
+            reverse_sql="""
+                UPDATE backend_order SET status = CASE status
+                    WHEN '0' THEN 'basket'
+                    WHEN '1' THEN 'confirmed'
+                    WHEN '2' THEN 'assembled'
+                    WHEN '3' THEN 'sent'
+                    WHEN '4' THEN 'delivered'
+                    WHEN '5' THEN 'cancelled'
+                END
+            """,
+        ),
+        migrations.RunSQL(
+            sql="UPDATE backend_user SET type = CASE type WHEN 'shop' THEN '0' ELSE '1' END",
+            reverse_sql="UPDATE backend_user SET type = CASE type WHEN '0' THEN 'shop' ELSE 'customer' END",
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'В корзине'), (1, 'Подтвержден'), (2, 'Собран'), (3, 'Отправлен'), (4, 'Выполнен'), (5, 'Отменен')], db_index=True, default=0),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Магазин'), (1, 'Покупатель')], db_index=True, default=1, verbose_name='Тип пользователя'),
+        ),
+    ]
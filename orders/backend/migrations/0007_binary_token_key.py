@@ -0,0 +1,58 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:22
+
+from django.db import migrations, models
+
+
+def convert_keys(apps, schema_editor):
+    """
+    Переносит hex-ключи в бинарную колонку. Ключи, которые нельзя
+    представить байтами (нечетная длина), удаляются - их нужно запросить заново
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute("DELETE FROM backend_confirmemailtoken WHERE key !~* '^([0-9a-f]{2})+$'")
+        schema_editor.execute("UPDATE backend_confirmemailtoken SET key_bin = decode(key, 'hex')")
+        return
+    ConfirmEmailToken = apps.get_model('backend', 'ConfirmEmailToken')
+    for token in ConfirmEmailToken.objects.all():
+        try:
+            token.key_bin = bytes.fromhex(token.key)
+        except ValueError:
+            token.delete()
+        else:
+            token.save(update_fields=['key_bin'])
+
+
+def delete_tokens(apps, schema_editor):
+    schema_editor.execute('DELETE FROM backend_confirmemailtoken')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0006_integer_status_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='confirmemailtoken',
+            name='key_bin',
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.RunPython(convert_keys, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='confirmemailtoken',
+            name='key',
+        ),
+        migrations.RenameField(
+            model_name='confirmemailtoken',
+            old_name='key_bin',
+            new_name='key',
+        ),
+        migrations.AlterField(
+            model_name='confirmemailtoken',
+            name='key',
+            field=models.BinaryField(db_index=True, max_length=32, unique=True, verbose_name='Key'),
+        ),
+        # при откате старую уникальную колонку нельзя заполнить, поэтому токены удаляются
+        migrations.RunPython(migrations.RunPython.noop, delete_tokens),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0007_binary_token_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(status=0), fields=['user'], name='idx_order_basket'),
+        ),
+    ]
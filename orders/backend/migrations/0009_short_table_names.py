@@ -0,0 +1,45 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0008_order_basket_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='orderitem',
+            name='price',
+            field=models.DecimalField(db_column='p', decimal_places=2, max_digits=10, verbose_name='Цена'),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='quantity',
+            field=models.PositiveIntegerField(db_column='q', default=1),
+        ),
+        migrations.AlterField(
+            model_name='productinfo',
+            name='price',
+            field=models.DecimalField(db_column='p', decimal_places=2, max_digits=10, verbose_name='Цена'),
+        ),
+        migrations.AlterField(
+            model_name='productinfo',
+            name='quantity',
+            field=models.PositiveIntegerField(db_column='q', verbose_name='Количество'),
+        ),
+        migrations.AlterModelTable(
+            name='orderitem',
+            table='oi',
+        ),
+        migrations.AlterModelTable(
+            name='productinfo',
+            table='pi',
+        ),
+        migrations.AlterModelTable(
+            name='productparameter',
+            table='pp',
+        ),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0009_short_table_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productinfo',
+            name='price_cents',
+            field=models.PositiveIntegerField(default=0, verbose_name='Цена в копейках'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='productinfo',
+            name='price_rrc_cents',
+            field=models.PositiveIntegerField(default=0, verbose_name='Рекомендуемая розничная цена в копейках'),
+            preserve_default=False,
+        ),
+        migrations.RunSQL(
+            sql='UPDATE pi SET price_cents = CAST(ROUND(p * 100) AS INTEGER), '
+                'price_rrc_cents = CAST(ROUND(price_rrc * 100) AS INTEGER)',
+            reverse_sql='UPDATE pi SET p = price_cents / 100.0, price_rrc = price_rrc_cents / 100.0',
+        ),
+        # при откате RemoveField вернет колонки со значением 0, их перезапишет обратный UPDATE
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='productinfo',
+                    name='price',
+                    field=models.DecimalField(db_column='p', decimal_places=2, default=0, max_digits=10, verbose_name='Цена'),
+                ),
+                migrations.AlterField(
+                    model_name='productinfo',
+                    name='price_rrc',
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Рекомендуемая розничная цена'),
+                ),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='productinfo',
+            name='price',
+        ),
+        migrations.RemoveField(
+            model_name='productinfo',
+            name='price_rrc',
+        ),
+        migrations.RenameField(
+            model_name='productinfo',
+            old_name='price_cents',
+            new_name='price',
+        ),
+        migrations.RenameField(
+            model_name='productinfo',
+            old_name='price_rrc_cents',
+            new_name='price_rrc',
+        ),
+        migrations.AlterField(
+            model_name='productinfo',
+            name='price',
+            field=models.PositiveIntegerField(db_column='p', verbose_name='Цена в копейках'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='price_cents',
+            field=models.PositiveIntegerField(default=0, verbose_name='Цена в копейках'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='price_rrc_cents',
+            field=models.PositiveIntegerField(default=0, verbose_name='Рекомендуемая розничная цена в копейках'),
+            preserve_default=False,
+        ),
+        migrations.RunSQL(
+            sql='UPDATE oi SET price_cents = CAST(ROUND(p * 100) AS INTEGER), '
+                'price_rrc_cents = CAST(ROUND(price_rrc * 100) AS INTEGER)',
+            reverse_sql='UPDATE oi SET p = price_cents / 100.0, price_rrc = price_rrc_cents / 100.0',
+        ),
+        # при откате RemoveField вернет колонки со значением 0, их перезапишет обратный UPDATE
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='orderitem',
+                    name='price',
+                    field=models.DecimalField(db_column='p', decimal_places=2, default=0, max_digits=10, verbose_name='Цена'),
+                ),
+                migrations.AlterField(
+                    model_name='orderitem',
+                    name='price_rrc',
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Рекомендуемая розничная цена'),
+                ),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='orderitem',
+            name='price',
+        ),
+        migrations.RemoveField(
+            model_name='orderitem',
+            name='price_rrc',
+        ),
+        migrations.RenameField(
+            model_name='orderitem',
+            old_name='price_cents',
+            new_name='price',
+        ),
+        migrations.RenameField(
+            model_name='orderitem',
+            old_name='price_rrc_cents',
+            new_name='price_rrc',
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='price',
+            field=models.PositiveIntegerField(db_column='p', verbose_name='Цена в копейках'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:28
+
+from django.db import migrations
+
+
+def set_key_default(apps, schema_editor):
+    """
+    Ключ по умолчанию генерирует сама БД - для загрузки токенов через COPY/INSERT без Python.
+    В SQLite изменить DEFAULT колонки можно только пересборкой таблицы, там ничего не делаем
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    schema_editor.execute('ALTER TABLE "backend_confirmemailtoken" ALTER COLUMN "key" SET DEFAULT gen_random_bytes(32)')
+
+
+def drop_key_default(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE "backend_confirmemailtoken" ALTER COLUMN "key" DROP DEFAULT')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0010_price_cents'),
+    ]
+
+    operations = [
+        migrations.RunPython(set_key_default, drop_key_default),
+    ]
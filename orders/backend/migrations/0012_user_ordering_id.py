@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:27
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0011_token_key_db_default'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='user',
+            options={'ordering': ('id',), 'verbose_name': 'Пользователь', 'verbose_name_plural': 'Список пользователей'},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-15 17:33
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0012_user_ordering_id'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='backend_ord_user_id_24dc94_idx',
+        ),
+    ]
@@ -1,18 +1,50 @@
+import logging
+import secrets
+from decimal import Decimal
+
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.db import models
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
-from django_rest_passwordreset.tokens import get_token_generator
 
-STATE_CHOICES = (('basket', 'В корзине'),
-                 ('confirmed', 'Подтвержден'),
-                 ('assembled', 'Собран'),
-                 ('sent', 'Отправлен'),
-                 ('delivered', 'Выполнен'),
-                 ('cancelled', 'Отменен'))
-USER_TYPE_CHOICES = (('shop', 'Магазин'),
-                     ('customer', 'Покупатель'))
+STATE_BASKET = 0
+STATE_CONFIRMED = 1
+STATE_ASSEMBLED = 2
+STATE_SENT = 3
+STATE_DELIVERED = 4
+STATE_CANCELLED = 5
+STATE_CHOICES = ((STATE_BASKET, 'В корзине'),
+                 (STATE_CONFIRMED, 'Подтвержден'),
+                 (STATE_ASSEMBLED, 'Собран'),
+                 (STATE_SENT, 'Отправлен'),
+                 (STATE_DELIVERED, 'Выполнен'),
+                 (STATE_CANCELLED, 'Отменен'))
+
+USER_TYPE_SHOP = 0
+USER_TYPE_CUSTOMER = 1
+USER_TYPE_CHOICES = ((USER_TYPE_SHOP, 'Магазин'),
+                     (USER_TYPE_CUSTOMER, 'Покупатель'))
+
+logger = logging.getLogger(__name__)
+
+
+class NarrowSaveModel(models.Model):
+    """
+    Миксин, предупреждающий о сохранении существующей записи без update_fields
+    (такой save() перезаписывает все колонки строки)
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is None and not self._state.adding:
+            logger.warning('%s(pk=%s) saved without update_fields', type(self).__name__, self.pk)
+        return super().save(*args, **kwargs)
 
 
 class UserManager(BaseUserManager):
@@ -51,7 +83,7 @@ class UserManager(BaseUserManager):
 
 
 
-class User(AbstractUser):
+class User(NarrowSaveModel, AbstractUser):
     """
     Стандартная модель пользователей
     """
@@ -80,7 +112,8 @@ class User(AbstractUser):
             'Unselect this instead of deleting accounts.'
         ),
     )
-    type = models.CharField(verbose_name='Тип пользователя', choices=USER_TYPE_CHOICES, max_length=5, default='buyer')
+    type = models.PositiveSmallIntegerField(verbose_name='Тип пользователя', choices=USER_TYPE_CHOICES,
+                                            default=USER_TYPE_CUSTOMER, db_index=True)
 
     def __str__(self):
         return f'{self.first_name} {self.last_name}'
@@ -88,10 +121,10 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = "Список пользователей"
-        ordering = ('email',)
+        ordering = ('id',)
 
 
-class Shop(models.Model):
+class Shop(NarrowSaveModel):
     name = models.CharField(max_length=50, verbose_name='Название')
     url = models.URLField(verbose_name='Ссылка', null=True, blank=True)
     user = models.OneToOneField(User, verbose_name='Пользователь',
@@ -108,9 +141,20 @@ class Shop(models.Model):
         return self.name
 
 
+class CategoryQuerySet(models.QuerySet):
+
+    def for_shops(self, shop_ids):
+        """
+        Категории магазинов: подзапрос по индексу shop_id связующей таблицы вместо JOIN с DISTINCT
+        """
+        through = self.model.shops.through.objects.filter(shop_id__in=shop_ids)
+        return self.filter(id__in=through.values('category_id'))
+
+
 class Category(models.Model):
     shops = models.ManyToManyField(related_name='shop_category', to=Shop)
     name = models.CharField(verbose_name="Категория", max_length=50)
+    objects = CategoryQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Категория'
@@ -122,13 +166,39 @@ class Product(models.Model):
     name = models.CharField(verbose_name='Название', max_length=50)
 
 
-class ProductInfo(models.Model):
+class ProductInfoQuerySet(models.QuerySet):
+
+    def with_relations(self):
+        """
+        Подтягивает товар, его категорию и магазин одним JOIN
+        """
+        return self.select_related('product__category', 'shop')
+
+
+class ProductInfo(NarrowSaveModel):
     product = models.ForeignKey(Product, related_name='product', on_delete=models.CASCADE)
     shop = models.ForeignKey(Shop, related_name='shop_product', on_delete=models.CASCADE)
-    name = Product.name
-    quantity = models.PositiveIntegerField(verbose_name="Количество")
-    price = models.DecimalField(verbose_name='Цена', decimal_places=2, max_digits=10)
-    price_rrc = models.DecimalField(verbose_name='Рекомендуемая розничная цена', decimal_places=2, max_digits=10)
+    quantity = models.PositiveIntegerField(verbose_name="Количество", db_column='q')
+    price = models.PositiveIntegerField(verbose_name='Цена в копейках', db_column='p')
+    price_rrc = models.PositiveIntegerField(verbose_name='Рекомендуемая розничная цена в копейках')
+    objects = ProductInfoQuerySet.as_manager()
+
+    @property
+    def price_rub(self):
+        return Decimal(self.price).scaleb(-2)
+
+    class Meta:
+        db_table = 'pi'
+        indexes = [
+            models.Index(fields=['shop', 'product'], name='backend_pro_shop_id_c479b9_idx'),
+        ]
+
+    @classmethod
+    def stream_all(cls, chunk_size=2000):
+        """
+        Обход всего прайса порциями (серверный курсор на Postgres) без загрузки всех строк в память
+        """
+        return cls.objects.with_relations().iterator(chunk_size=chunk_size)
 
 
 class Parameter(models.Model):
@@ -144,24 +214,67 @@ class ProductParameter(models.Model):
                                   on_delete=models.CASCADE)
     value = models.CharField(verbose_name="Значение", max_length=300)
 
+    class Meta:
+        db_table = 'pp'
+
 
-class Order(models.Model):
+class OrderQuerySet(models.QuerySet):
+
+    def with_total(self):
+        """
+        Добавляет сумму заказа в копейках, посчитанную одним агрегатом в БД.
+        Количество приводится к bigint: на Postgres произведение двух integer переполняется на 2^31 копеек
+        """
+        line_total = Cast('order__quantity', models.BigIntegerField()) * models.F('order__price')
+        return self.annotate(total=Coalesce(models.Sum(line_total, output_field=models.BigIntegerField()), 0,
+                                            output_field=models.BigIntegerField()))
+
+    def with_items(self):
+        """
+        Заказы с позициями в списке items_cached: один IN-запрос на всю страницу заказов
+        """
+        return self.prefetch_related(
+            models.Prefetch('order', queryset=OrderItem.objects.with_relations(), to_attr='items_cached'))
+
+
+class Order(NarrowSaveModel):
     user = models.ForeignKey(User, related_name='user_order', on_delete=models.CASCADE, blank=True)
     dt = models.DateTimeField()
-    status = models.CharField(choices=STATE_CHOICES, max_length=50)
+    status = models.PositiveSmallIntegerField(choices=STATE_CHOICES, default=STATE_BASKET, db_index=True)
+    objects = OrderQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Заказ"
         verbose_name_plural = "Заказы"
+        indexes = [
+            models.Index(fields=['user'], condition=models.Q(status=STATE_BASKET), name='idx_order_basket'),
+        ]
+
+
+class OrderItemQuerySet(models.QuerySet):
+
+    def with_relations(self):
+        """
+        Позиции заказа сразу с товаром, его категорией и магазином
+        """
+        return self.select_related('product__category', 'shop')
 
 
 class OrderItem(models.Model):
     order = models.ForeignKey(Order, related_name='order', on_delete=models.CASCADE)
     product = models.ForeignKey(Product, related_name='product_order_item', on_delete=models.CASCADE)
     shop = models.ForeignKey(Shop, related_name='shop_order', on_delete=models.CASCADE)
-    quantity = models.PositiveIntegerField(default=1)
+    quantity = models.PositiveIntegerField(default=1, db_column='q')
+    price = models.PositiveIntegerField(verbose_name='Цена в копейках', db_column='p')
+    price_rrc = models.PositiveIntegerField(verbose_name='Рекомендуемая розничная цена в копейках')
+    objects = OrderItemQuerySet.as_manager()
+
+    @property
+    def price_rub(self):
+        return Decimal(self.price).scaleb(-2)
 
     class Meta:
+        db_table = 'oi'
         verbose_name = "Заказанная позиция"
         verbose_name_plural = "Список заказанных позиций"
 
@@ -186,8 +299,14 @@ class ConfirmEmailToken(models.Model):
 
     @staticmethod
     def generate_key():
-        """ generates a pseudo random code using os.urandom and binascii.hexlify """
-        return get_token_generator().generate_token()
+        """ generates 32 random bytes using os.urandom """
+        return secrets.token_bytes(32)
+
+    @classmethod
+    def bulk_issue(cls, users):
+        """ creates tokens for several users with batched INSERTs instead of a save() per token """
+        return cls.objects.bulk_create([cls(user=user, key=cls.generate_key()) for user in users],
+                                       batch_size=1000)
 
     user = models.ForeignKey(
         User,
@@ -202,17 +321,44 @@ class ConfirmEmailToken(models.Model):
     )
 
     # Key field, though it is not the primary key of the model
-    key = models.CharField(
+    key = models.BinaryField(
         _("Key"),
-        max_length=64,
+        max_length=32,
         db_index=True,
         unique=True
     )
 
-    def save(self, *args, **kwargs):
-        if not self.key:
-            self.key = self.generate_key()
-        return super(ConfirmEmailToken, self).save(*args, **kwargs)
+    @property
+    def key_hex(self):
+        """ key as a hex string, the form used in URLs and emails """
+        return bytes(self.key).hex()
 
     def __str__(self):
-        return "Password reset token for user {user}".format(user=self.user)
\ No newline at end of file
+        return "Password reset token for user {user_id}".format(user_id=self.user_id)
+
+
+@receiver(pre_save, sender=ConfirmEmailToken)
+def fill_confirm_email_token_key(sender, instance, **kwargs):
+    """
+    Генерирует ключ токена перед сохранением, если он не задан
+    (bulk_create сигналы не отправляет - ключи для него выдает ConfirmEmailToken.bulk_issue)
+    """
+    if not instance.key:
+        instance.key = sender.generate_key()
+
+
+@receiver(pre_save, sender=OrderItem)
+def fill_order_item_price(sender, instance, **kwargs):
+    """
+    Фиксирует цены позиции по прайсу магазина в момент добавления в корзину, если они не заданы
+    """
+    if instance.price is not None and instance.price_rrc is not None:
+        return
+    prices = ProductInfo.objects.filter(product_id=instance.product_id, shop_id=instance.shop_id) \
+        .values_list('price', 'price_rrc').first()
+    if prices is None:
+        return
+    if instance.price is None:
+        instance.price = prices[0]
+    if instance.price_rrc is None:
+        instance.price_rrc = prices[1]
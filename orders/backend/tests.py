@@ -1,3 +1,197 @@
-from django.test import TestCase
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from .models import (STATE_BASKET, STATE_SENT, USER_TYPE_CUSTOMER, USER_TYPE_SHOP, Category, ConfirmEmailToken,
+                     Order, OrderItem, Product, ProductInfo, Shop, User)
+
+
+class CatalogMixin:
+    """
+    Магазин с одним товаром в прайсе и заказ покупателя
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user('buyer@example.com', 'password')
+        self.shop = Shop.objects.create(name='Связной')
+        self.category = Category.objects.create(name='Смартфоны')
+        self.category.shops.add(self.shop)
+        self.product = Product.objects.create(name='iPhone', category=self.category)
+        self.product_info = ProductInfo.objects.create(product=self.product, shop=self.shop, quantity=10,
+                                                       price=11000000, price_rrc=11500000)
+        self.order = Order.objects.create(user=self.user, dt=timezone.now())
+
+
+class OrderItemPriceTestCase(CatalogMixin, TestCase):
+
+    def test_price_captured_from_product_info(self):
+        item = OrderItem.objects.create(order=self.order, product=self.product, shop=self.shop, quantity=2)
+        item.refresh_from_db()
+        self.assertEqual(item.price, 11000000)
+        self.assertEqual(item.price_rrc, 11500000)
+
+    def test_price_not_changed_after_price_list_update(self):
+        item = OrderItem.objects.create(order=self.order, product=self.product, shop=self.shop)
+        ProductInfo.objects.filter(pk=self.product_info.pk).update(price=12000000)
+        item.quantity = 3
+        item.save()
+        item.refresh_from_db()
+        self.assertEqual(item.price, 11000000)
+
+    def test_explicit_price_kept(self):
+        item = OrderItem.objects.create(order=self.order, product=self.product, shop=self.shop,
+                                        price=100, price_rrc=200)
+        item.refresh_from_db()
+        self.assertEqual((item.price, item.price_rrc), (100, 200))
+
+
+class OrderTotalTestCase(CatalogMixin, TestCase):
+
+    def test_total_in_kopecks(self):
+        OrderItem.objects.create(order=self.order, product=self.product, shop=self.shop, quantity=2)
+        self.assertEqual(Order.objects.with_total().get(pk=self.order.pk).total, 22000000)
+
+    def test_large_line_total(self):
+        # 1000 шт. по 25 000 руб. - больше 2^31 копеек
+        OrderItem.objects.create(order=self.order, product=self.product, shop=self.shop, quantity=1000,
+                                 price=2500000, price_rrc=2500000)
+        self.assertEqual(Order.objects.with_total().get(pk=self.order.pk).total, 2500000000)
+
+    def test_empty_order_total_is_zero(self):
+        self.assertEqual(Order.objects.with_total().get(pk=self.order.pk).total, 0)
+
+    def test_price_rub(self):
+        self.assertEqual(str(self.product_info.price_rub), '110000.00')
+
+
+class ConfirmEmailTokenTestCase(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('buyer@example.com', 'password')
+
+    def test_key_generated_on_save(self):
+        token = ConfirmEmailToken.objects.create(user=self.user)
+        token.refresh_from_db()
+        self.assertEqual(len(bytes(token.key)), 32)
+        self.assertEqual(len(token.key_hex), 64)
+        self.assertEqual(ConfirmEmailToken.objects.get(key=bytes.fromhex(token.key_hex)), token)
+
+    def test_explicit_key_kept(self):
+        token = ConfirmEmailToken.objects.create(user=self.user, key=b'\x01' * 32)
+        token.refresh_from_db()
+        self.assertEqual(bytes(token.key), b'\x01' * 32)
+
+    def test_bulk_issue(self):
+        other = User.objects.create_user('shop@example.com', 'password')
+        ConfirmEmailToken.bulk_issue([self.user, other, self.user])
+        keys = [bytes(key) for key in ConfirmEmailToken.objects.values_list('key', flat=True)]
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(len(set(keys)), 3)
+        self.assertTrue(all(len(key) == 32 for key in keys))
+
+    def test_str_uses_user_id(self):
+        token = ConfirmEmailToken.objects.create(user=self.user)
+        token = ConfirmEmailToken.objects.get(pk=token.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(token), 'Password reset token for user {}'.format(self.user.pk))
+
+
+class ChoicesTestCase(TestCase):
+
+    def test_status_and_type_codes(self):
+        user = User.objects.create_user('shop@example.com', 'password', type=USER_TYPE_SHOP)
+        order = Order.objects.create(user=user, dt=timezone.now(), status=STATE_SENT)
+        self.assertEqual(User.objects.get(pk=user.pk).type, USER_TYPE_SHOP)
+        self.assertEqual(Order.objects.get(pk=order.pk).get_status_display(), 'Отправлен')
+        self.assertEqual(User.objects.create_user('buyer@example.com', 'password').type, USER_TYPE_CUSTOMER)
+        self.assertEqual(Order.objects.create(user=user, dt=timezone.now()).status, STATE_BASKET)
+
+
+class CategoryForShopsTestCase(TestCase):
+
+    def test_category_returned_once(self):
+        first = Shop.objects.create(name='Первый')
+        second = Shop.objects.create(name='Второй')
+        other = Shop.objects.create(name='Другой')
+        shared = Category.objects.create(name='Общая')
+        shared.shops.add(first, second)
+        Category.objects.create(name='Чужая').shops.add(other)
+        self.assertEqual(list(Category.objects.for_shops([first.pk, second.pk])), [shared])
+
+
+class NarrowSaveTestCase(TestCase):
+
+    def test_warning_only_for_updates(self):
+        with mock.patch('backend.models.logger') as logger:
+            shop = Shop.objects.create(name='Связной')
+            logger.warning.assert_not_called()
+            shop.state = False
+            shop.save(update_fields=['state'])
+            logger.warning.assert_not_called()
+            shop.save()
+            logger.warning.assert_called_once()
+
+
+class DataMigrationTestCase(TransactionTestCase):
+    """
+    Перенос данных в миграциях 0006 (коды статусов), 0007 (бинарный ключ) и 0010 (цены в копейках)
+    """
+    before = [('backend', '0005_orderitem_price')]
+    after = [('backend', '0010_price_cents')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+
+    def setUp(self):
+        self.migrate(self.before)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO backend_user (id, password, is_superuser, first_name, last_name, is_staff, "
+                "date_joined, email, company, position, username, is_active, type) VALUES "
+                "(1, '', 0, '', '', 0, '2021-01-01', 'shop@example.com', '', '', 'shop', 1, 'shop'), "
+                "(2, '', 0, '', '', 0, '2021-01-01', 'buyer@example.com', '', '', 'buyer', 1, 'buyer')")
+            cursor.execute("INSERT INTO backend_order (id, dt, status, user_id) VALUES "
+                           "(1, '2021-01-01', 'basket', 2), (2, '2021-01-01', 'sent', 2)")
+            cursor.execute("INSERT INTO backend_shop (id, name, state) VALUES (1, 'Связной', 1)")
+            cursor.execute("INSERT INTO backend_product (id, name) VALUES (1, 'iPhone')")
+            cursor.execute("INSERT INTO backend_productinfo (id, quantity, price, price_rrc, product_id, shop_id) "
+                           "VALUES (1, 5, 10.5, 12.99, 1, 1)")
+            cursor.execute("INSERT INTO backend_orderitem (id, quantity, price, price_rrc, order_id, product_id, "
+                           "shop_id) VALUES (1, 3, 10.5, 12.99, 1, 1, 1)")
+            cursor.execute("INSERT INTO backend_confirmemailtoken (id, created_at, key, user_id) VALUES "
+                           "(1, '2021-01-01', '{}', 2), (2, '2021-01-01', 'abc', 2)".format('ff' * 32))
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes('backend'))
+
+    def test_forward(self):
+        self.migrate(self.after)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT id, status FROM backend_order ORDER BY id')
+            self.assertEqual(cursor.fetchall(), [(1, STATE_BASKET), (2, STATE_SENT)])
+            cursor.execute('SELECT id, type FROM backend_user ORDER BY id')
+            self.assertEqual(cursor.fetchall(), [(1, USER_TYPE_SHOP), (2, USER_TYPE_CUSTOMER)])
+            cursor.execute('SELECT p, price_rrc FROM pi')
+            self.assertEqual(cursor.fetchall(), [(1050, 1299)])
+            cursor.execute('SELECT p, price_rrc FROM oi')
+            self.assertEqual(cursor.fetchall(), [(1050, 1299)])
+            cursor.execute('SELECT id, key FROM backend_confirmemailtoken')
+            self.assertEqual([(pk, bytes(key)) for pk, key in cursor.fetchall()], [(1, b'\xff' * 32)])
+
+    def test_backward(self):
+        self.migrate(self.after)
+        self.migrate(self.before)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT id, status FROM backend_order ORDER BY id')
+            self.assertEqual(cursor.fetchall(), [(1, 'basket'), (2, 'sent')])
+            cursor.execute('SELECT id, type FROM backend_user ORDER BY id')
+            self.assertEqual(cursor.fetchall(), [(1, 'shop'), (2, 'customer')])
+            cursor.execute('SELECT price, price_rrc FROM backend_productinfo')
+            self.assertEqual([tuple(Decimal(str(value)) for value in row) for row in cursor.fetchall()],
+                             [(Decimal('10.5'), Decimal('12.99'))])